@@ -1,7 +1,12 @@
+import os
+# one OpenMP thread per process (set before importing numpy/torch so that the environment workers inherit it)
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 import gym
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import numpy as np
 
 # Import the skrl components to build the RL system
@@ -14,103 +19,182 @@ from skrl.resources.schedulers.torch import KLAdaptiveRL
 from skrl.envs.torch import wrap_env
 
 
-# Define the models (stochastic and deterministic models) for the agent using mixins.
-# - Policy: takes as input the environment's observation/state and returns an action
-# - Value: takes the state as input and provides a value to guide the policy
-class Policy(GaussianMixin, Model):
-    def __init__(self, observation_space, action_space, device, clip_actions=False,
-                 clip_log_std=True, min_log_std=-20, max_log_std=2, reduction="sum"):
-        Model.__init__(self, observation_space, action_space, device)
-        GaussianMixin.__init__(self, clip_actions, clip_log_std, min_log_std, max_log_std, reduction)
+# Pointwise epilogue (tanh + scaling) compiled into a single kernel that reads and writes the data once.
+# Otherwise, it is scripted so that the TorchScript fuser can merge it
+def scaled_tanh(x: torch.Tensor, scale: float) -> torch.Tensor:
+    return scale * torch.tanh(x)
 
-        self.net = nn.Sequential(nn.Linear(self.num_observations, 64),
-                                 nn.ReLU(),
-                                 nn.Linear(64, 64),
-                                 nn.ReLU(),
-                                 nn.Linear(64, self.num_actions))
-        self.log_std_parameter = nn.Parameter(torch.zeros(self.num_actions))
+if torch.cuda.is_available() and hasattr(torch, "compile"):
+    scaled_tanh = torch.compile(scaled_tanh, fullgraph=True)
+else:
+    scaled_tanh = torch.jit.script(scaled_tanh)
 
-    def compute(self, inputs, role):
-        # Pendulum-v1 action_space is -2 to 2
-        return 2 * torch.tanh(self.net(inputs["states"])), self.log_std_parameter, {}
 
-class Value(DeterministicMixin, Model):
-    def __init__(self, observation_space, action_space, device, clip_actions=False):
+# Feature extractor (trunk) written with functional calls instead of nn.Sequential.
+# It avoids the per-layer module call overhead and can be scripted or compiled as a whole
+class MLP(nn.Module):
+    def __init__(self, in_features, hidden_features):
+        super().__init__()
+        # parameters with the default nn.Linear initialization
+        fc1, fc2 = nn.Linear(in_features, hidden_features), nn.Linear(hidden_features, hidden_features)
+        self.w1, self.b1 = fc1.weight, fc1.bias
+        self.w2, self.b2 = fc2.weight, fc2.bias
+
+    def forward(self, x):
+        return F.relu(F.linear(F.relu(F.linear(x, self.w1, self.b1)), self.w2, self.b2))
+
+
+# Define the shared model (stochastic and deterministic models) for the agent using mixins.
+# The policy and the value functions share the same feature extractor (trunk) and have their own output layer
+class Shared(GaussianMixin, DeterministicMixin, Model):
+    def __init__(self, observation_space, action_space, device, clip_actions=False,
+                 clip_log_std=True, min_log_std=-20, max_log_std=2, reduction="sum", rollout_bfloat16=False):
         Model.__init__(self, observation_space, action_space, device)
-        DeterministicMixin.__init__(self, clip_actions)
+        GaussianMixin.__init__(self, clip_actions, clip_log_std, min_log_std, max_log_std, reduction, role="policy")
+        DeterministicMixin.__init__(self, clip_actions=False, role="value")
+
+        self.net = MLP(self.num_observations, 64)
 
-        self.net = nn.Sequential(nn.Linear(self.num_observations, 64),
-                                 nn.ReLU(),
-                                 nn.Linear(64, 64),
-                                 nn.ReLU(),
-                                 nn.Linear(64, 1))
+        self.mean_layer = nn.Linear(64, self.num_actions)
+        self.log_std_parameter = nn.Parameter(torch.zeros(self.num_actions))
+
+        self.value_layer = nn.Linear(64, 1)
+
+        # opt-in bfloat16 autocast for the action sampling (no-grad) forward pass. The updates keep full FP32 precision
+        self.rollout_bfloat16 = rollout_bfloat16
+
+        # FP32 trunk output computed by the policy and the states it was computed for.
+        # A following value call on the same states tensor (e.g. the mini-batches of each update) reuses it
+        self._shared_states = None
+        self._shared_output = None
+
+        # compile the whole model call of each role (trunk, output layer and the mixin's sampling and log-probability
+        # computation) so that the operations are fused across module boundaries (requires PyTorch 2.0+).
+        # The graph may break inside the mixins, hence fullgraph=False. Otherwise, script the trunk
+        # (it takes the states tensor directly, not the inputs dictionary)
+        if torch.cuda.is_available() and hasattr(torch, "compile"):
+            self._act = torch.compile(self._act, mode="reduce-overhead", fullgraph=False, dynamic=False)
+        else:
+            self.net = torch.jit.script(self.net)
+
+    def act(self, inputs, role):
+        # the states are matched by identity outside the compiled call, so that it is neither guarded nor recompiled
+        if role == "policy":
+            actions, log_prob, outputs = self._act(inputs, role)
+            self._shared_states, self._shared_output = inputs["states"], outputs.pop("shared_output", None)
+            return actions, log_prob, outputs
+        elif role == "value":
+            if self._shared_output is not None and inputs["states"] is self._shared_states:
+                inputs = {**inputs, "shared_output": self._shared_output}
+            self._shared_states, self._shared_output = None, None
+            return self._act(inputs, role)
+
+    def _act(self, inputs, role):
+        if role == "policy":
+            return GaussianMixin.act(self, inputs, role)
+        elif role == "value":
+            return DeterministicMixin.act(self, inputs, role)
 
     def compute(self, inputs, role):
-        return self.net(inputs["states"]), {}
+        states = inputs["states"]
+        if role == "policy":
+            # the bfloat16 features are not shared: the values are always computed from FP32 features
+            if self.rollout_bfloat16 and not torch.is_grad_enabled():
+                with torch.autocast(device_type=self.device.type, dtype=torch.bfloat16):
+                    mean_actions = self.mean_layer(self.net(states))
+                mean_actions, outputs = mean_actions.float(), {}
+            else:
+                shared_output = self.net(states)
+                mean_actions, outputs = self.mean_layer(shared_output), {"shared_output": shared_output}
+            # Pendulum-v1 action_space is -2 to 2
+            return scaled_tanh(mean_actions, 2.0), self.log_std_parameter, outputs
+        elif role == "value":
+            shared_output = inputs["shared_output"] if "shared_output" in inputs else self.net(states)
+            return self.value_layer(shared_output), {}
 
 
 # Gym environment observation wrapper used to mask velocity. Adapted from rl_zoo3 (rl_zoo3/wrappers.py)
 class NoVelocityWrapper(gym.ObservationWrapper):
+    def __init__(self, env):
+        super().__init__(env)
+        # mask (x, y, angular velocity) computed once instead of on every step
+        self._mask = np.array([1, 1, 0], dtype=env.observation_space.dtype)
+
     def observation(self, observation):
         # observation: x, y, angular velocity
-        return observation * np.array([1, 1, 0])
-
-gym.envs.registration.register(id="PendulumNoVel-v1", entry_point=lambda: NoVelocityWrapper(gym.make("Pendulum-v1")))
-
-# Load and wrap the Gym environment
-env = gym.vector.make("PendulumNoVel-v1", num_envs=4, asynchronous=False)
-env = wrap_env(env)
-
-device = env.device
-
-
-# Instantiate a RandomMemory as rollout buffer (any memory can be used for this)
-memory = RandomMemory(memory_size=1024, num_envs=env.num_envs, device=device)
-
-
-# Instantiate the agent's models (function approximators).
-# A2C requires 2 models, visit its documentation for more details
-# https://skrl.readthedocs.io/en/latest/modules/skrl.agents.a2c.html#spaces-and-models
-models_a2c = {}
-models_a2c["policy"] = Policy(env.observation_space, env.action_space, device, clip_actions=True)
-models_a2c["value"] = Value(env.observation_space, env.action_space, device)
-
-
-# Configure and instantiate the agent.
-# Only modify some of the default configuration, visit its documentation to see all the options
-# https://skrl.readthedocs.io/en/latest/modules/skrl.agents.a2c.html#configuration-and-hyperparameters
-cfg_a2c = A2C_DEFAULT_CONFIG.copy()
-cfg_a2c["rollouts"] = 1024  # memory_size
-cfg_a2c["learning_epochs"] = 10
-cfg_a2c["mini_batches"] = 32
-cfg_a2c["discount_factor"] = 0.9
-cfg_a2c["lambda"] = 0.95
-cfg_a2c["learning_rate"] = 1e-3
-cfg_a2c["learning_rate_scheduler"] = KLAdaptiveRL
-cfg_a2c["learning_rate_scheduler_kwargs"] = {"kl_threshold": 0.008, "min_lr": 5e-4}
-cfg_a2c["random_timesteps"] = 0
-cfg_a2c["learning_starts"] = 0
-cfg_a2c["grad_norm_clip"] = 0.5
-cfg_a2c["entropy_loss_scale"] = 0.0
-cfg_a2c["state_preprocessor"] = RunningStandardScaler
-cfg_a2c["state_preprocessor_kwargs"] = {"size": env.observation_space, "device": device}
-cfg_a2c["value_preprocessor"] = RunningStandardScaler
-cfg_a2c["value_preprocessor_kwargs"] = {"size": 1, "device": device}
-# logging to TensorBoard and write checkpoints each 500 and 5000 timesteps respectively
-cfg_a2c["experiment"]["write_interval"] = 500
-cfg_a2c["experiment"]["checkpoint_interval"] = 5000
-
-agent_ddpg = A2C(models=models_a2c,
-                 memory=memory,
-                 cfg=cfg_a2c,
-                 observation_space=env.observation_space,
-                 action_space=env.action_space,
-                 device=device)
-
-
-# Configure and instantiate the RL trainer
-cfg_trainer = {"timesteps": 100000, "headless": True}
-trainer = SequentialTrainer(cfg=cfg_trainer, env=env, agents=agent_ddpg)
-
-# start training
-trainer.train()
+        if observation.flags.writeable:
+            observation[..., -1] = 0
+            return observation
+        return observation * self._mask
+
+# module-level factory (instead of a lambda) so that the entry point can be pickled by the environment workers
+def _make_pendulum_novel():
+    return NoVelocityWrapper(gym.make("Pendulum-v1"))
+
+# the registration stays at module level: the environment workers call gym.make("PendulumNoVel-v1") themselves
+# and, under the spawn start method, they only see what is defined when re-importing this script
+gym.envs.registration.register(id="PendulumNoVel-v1", entry_point=_make_pendulum_novel)
+
+
+# guard the process-starting code: the environment workers re-import this script under the spawn start method
+if __name__ == '__main__':
+
+    # Load and wrap the Gym environment (each environment copy is stepped in its own worker process.
+    # The observations are exchanged through shared memory, the AsyncVectorEnv default)
+    env = gym.vector.make("PendulumNoVel-v1", num_envs=4, asynchronous=True)
+    env = wrap_env(env)
+
+    device = env.device
+
+
+    # Instantiate a RandomMemory as rollout buffer (any memory can be used for this)
+    memory = RandomMemory(memory_size=1024, num_envs=env.num_envs, device=device)
+
+
+    # Instantiate the agent's models (function approximators).
+    # A2C requires 2 models, visit its documentation for more details
+    # https://skrl.readthedocs.io/en/latest/modules/skrl.agents.a2c.html#spaces-and-models
+    models_a2c = {}
+    # set rollout_bfloat16=True to sample actions in bfloat16 (e.g. on Ampere or newer GPUs or CPUs with AVX-512 BF16)
+    models_a2c["policy"] = Shared(env.observation_space, env.action_space, device, clip_actions=True, rollout_bfloat16=False)
+    models_a2c["value"] = models_a2c["policy"]  # same instance: shared model
+
+
+    # Configure and instantiate the agent.
+    # Only modify some of the default configuration, visit its documentation to see all the options
+    # https://skrl.readthedocs.io/en/latest/modules/skrl.agents.a2c.html#configuration-and-hyperparameters
+    cfg_a2c = A2C_DEFAULT_CONFIG.copy()
+    cfg_a2c["rollouts"] = 1024  # memory_size
+    cfg_a2c["learning_epochs"] = 10
+    cfg_a2c["mini_batches"] = 32
+    cfg_a2c["discount_factor"] = 0.9
+    cfg_a2c["lambda"] = 0.95
+    cfg_a2c["learning_rate"] = 1e-3
+    cfg_a2c["learning_rate_scheduler"] = KLAdaptiveRL
+    cfg_a2c["learning_rate_scheduler_kwargs"] = {"kl_threshold": 0.008, "min_lr": 5e-4}
+    cfg_a2c["random_timesteps"] = 0
+    cfg_a2c["learning_starts"] = 0
+    cfg_a2c["grad_norm_clip"] = 0.5
+    cfg_a2c["entropy_loss_scale"] = 0.0
+    cfg_a2c["state_preprocessor"] = RunningStandardScaler
+    cfg_a2c["state_preprocessor_kwargs"] = {"size": env.observation_space, "device": device}
+    cfg_a2c["value_preprocessor"] = RunningStandardScaler
+    cfg_a2c["value_preprocessor_kwargs"] = {"size": 1, "device": device}
+    # logging to TensorBoard and write checkpoints each 500 and 5000 timesteps respectively
+    cfg_a2c["experiment"]["write_interval"] = 500
+    cfg_a2c["experiment"]["checkpoint_interval"] = 5000
+
+    agent_ddpg = A2C(models=models_a2c,
+                     memory=memory,
+                     cfg=cfg_a2c,
+                     observation_space=env.observation_space,
+                     action_space=env.action_space,
+                     device=device)
+
+
+    # Configure and instantiate the RL trainer
+    cfg_trainer = {"timesteps": 100000, "headless": True}
+    trainer = SequentialTrainer(cfg=cfg_trainer, env=env, agents=agent_ddpg)
+
+    # start training
+    trainer.train()
@@ -1,7 +1,9 @@
 import isaacgym
 
+import os
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 
 # Import the skrl components to build the RL system
 from skrl.models.torch import Model, GaussianMixin, DeterministicMixin
@@ -17,6 +19,28 @@ from skrl.utils import set_seed
 # set the seed for reproducibility
 set_seed(42)
 
+# opt-in TensorFloat-32 matrix multiplications on Ampere (or newer) GPUs (the models have no convolutions).
+# Run with SKRL_ALLOW_TF32=1 to enable it (by default, PyTorch computes the matrix multiplications in full FP32 precision)
+if os.environ.get("SKRL_ALLOW_TF32", "0") == "1":
+    torch.backends.cuda.matmul.allow_tf32 = True
+
+
+# Three-layer ELU perceptron evaluated with functional calls, without per-layer submodules.
+# The policy runs it eagerly, many times per update (conjugate gradient and line search), without going through
+# nn.Sequential's module calls. On CUDA, the value's compute method is compiled with the whole network in one graph
+class MLP(nn.Module):
+    def __init__(self, in_features, hidden_features, out_features):
+        super().__init__()
+        # the nn.Linear layers are only created to take their initialized weights and biases
+        fc1, fc2, fc3 = nn.Linear(in_features, hidden_features), nn.Linear(hidden_features, hidden_features), \
+            nn.Linear(hidden_features, out_features)
+        self.w1, self.b1 = fc1.weight, fc1.bias
+        self.w2, self.b2 = fc2.weight, fc2.bias
+        self.w3, self.b3 = fc3.weight, fc3.bias
+
+    def forward(self, x):
+        return F.linear(F.elu(F.linear(F.elu(F.linear(x, self.w1, self.b1)), self.w2, self.b2)), self.w3, self.b3)
+
 
 # Define the models (stochastic and deterministic models) for the agent using mixins.
 # - Policy: takes as input the environment's observation/state and returns an action
@@ -27,11 +51,7 @@ class Policy(GaussianMixin, Model):
         Model.__init__(self, observation_space, action_space, device)
         GaussianMixin.__init__(self, clip_actions, clip_log_std, min_log_std, max_log_std)
 
-        self.net = nn.Sequential(nn.Linear(self.num_observations, 32),
-                                 nn.ELU(),
-                                 nn.Linear(32, 32),
-                                 nn.ELU(),
-                                 nn.Linear(32, self.num_actions))
+        self.net = MLP(self.num_observations, 32, self.num_actions)
         self.log_std_parameter = nn.Parameter(torch.zeros(self.num_actions))
 
     def compute(self, inputs, role):
@@ -42,17 +62,22 @@ class Value(DeterministicMixin, Model):
         Model.__init__(self, observation_space, action_space, device)
         DeterministicMixin.__init__(self, clip_actions)
 
-        self.net = nn.Sequential(nn.Linear(self.num_observations, 32),
-                                 nn.ELU(),
-                                 nn.Linear(32, 32),
-                                 nn.ELU(),
-                                 nn.Linear(32, 1))
+        self.net = MLP(self.num_observations, 32, 1)
+
+        # fuse the small MLP into a single graph to reduce the kernel-launch overhead (requires PyTorch 2.0+).
+        # The method is compiled instead of the module, so that the parameter names (and the checkpoints) do not change.
+        # The policy is not compiled: TRPO's Fisher-vector product needs double backward, which is not supported
+        if torch.cuda.is_available() and hasattr(torch, "compile"):
+            self.compute = torch.compile(self.compute, mode="reduce-overhead", fullgraph=True, dynamic=False)
 
     def compute(self, inputs, role):
         return self.net(inputs["states"]), {}
 
 
-# Load and wrap the Isaac Gym environment
+# Load and wrap the Isaac Gym environment.
+# The networks are small, so the GPU is mostly idle with the default number of environments:
+# the simulation throughput (and the effective batch size) scales with num_envs up to a few thousands
+# (e.g. run with the command line argument num_envs=4096)
 env = load_isaacgym_env_preview4(task_name="Cartpole")   # preview 3 and 4 use the same loader
 env = wrap_env(env)
 
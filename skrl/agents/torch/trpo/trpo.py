@@ -420,7 +420,7 @@ class TRPO(Agent):
             return (advantages * torch.exp(new_log_prob - log_prob.detach())).mean()
 
         def conjugate_gradient(policy: Model,
-                               states: torch.Tensor,
+                               flat_kl_gradient: torch.Tensor,
                                b: torch.Tensor,
                                num_iterations: float = 10,
                                residual_tolerance: float = 1e-10) -> torch.Tensor:
@@ -430,8 +430,8 @@ class TRPO(Agent):
 
             :param policy: Policy
             :type policy: Model
-            :param states: States
-            :type states: torch.Tensor
+            :param flat_kl_gradient: Flattened gradient of the KL divergence (with its computational graph)
+            :type flat_kl_gradient: torch.Tensor
             :param b: Vector b
             :type b: torch.Tensor
             :param num_iterations: Number of iterations (default: 10)
@@ -447,7 +447,7 @@ class TRPO(Agent):
             p = b.clone()
             rr_old = torch.dot(r, r)
             for _ in range(num_iterations):
-                hv = fisher_vector_product(policy, states, p, damping=self._damping)
+                hv = fisher_vector_product(policy, flat_kl_gradient, p, damping=self._damping)
                 alpha = rr_old / torch.dot(p, hv)
                 x += alpha * p
                 r -= alpha * hv
@@ -458,8 +458,26 @@ class TRPO(Agent):
                 rr_old = rr_new
             return x
 
+        def kl_divergence_gradient(policy: Model, states: torch.Tensor) -> torch.Tensor:
+            """Compute the flattened gradient of the KL divergence of the policy with respect to itself
+
+            The computational graph is kept so that the Fisher vector product can be evaluated
+            for different vectors without recomputing the policy forward and the first backward pass
+
+            :param policy: Policy
+            :type policy: Model
+            :param states: States
+            :type states: torch.Tensor
+
+            :return: Flattened gradient of the KL divergence
+            :rtype: torch.Tensor
+            """
+            kl = kl_divergence(policy, policy, states)
+            kl_gradient = torch.autograd.grad(kl, policy.parameters(), create_graph=True)
+            return torch.cat([gradient.view(-1) for gradient in kl_gradient])
+
         def fisher_vector_product(policy: Model,
-                                  states: torch.Tensor,
+                                  flat_kl_gradient: torch.Tensor,
                                   vector: torch.Tensor,
                                   damping: float = 0.1) -> torch.Tensor:
             """Compute the Fisher vector product (direct method)
@@ -468,8 +486,8 @@ class TRPO(Agent):
 
             :param policy: Policy
             :type policy: Model
-            :param states: States
-            :type states: torch.Tensor
+            :param flat_kl_gradient: Flattened gradient of the KL divergence (with its computational graph)
+            :type flat_kl_gradient: torch.Tensor
             :param vector: Vector
             :type vector: torch.Tensor
             :param damping: Damping (default: 0.1)
@@ -478,10 +496,7 @@ class TRPO(Agent):
             :return: Hessian vector product
             :rtype: torch.Tensor
             """
-            kl = kl_divergence(policy, policy, states)
-            kl_gradient = torch.autograd.grad(kl, policy.parameters(), create_graph=True)
-            flat_kl_gradient = torch.cat([gradient.view(-1) for gradient in kl_gradient])
-            hessian_vector_gradient = torch.autograd.grad((flat_kl_gradient * vector).sum(), policy.parameters())
+            hessian_vector_gradient = torch.autograd.grad((flat_kl_gradient * vector).sum(), policy.parameters(), retain_graph=True)
             flat_hessian_vector_gradient = torch.cat([gradient.contiguous().view(-1) for gradient in hessian_vector_gradient])
             return flat_hessian_vector_gradient + damping * vector
 
@@ -552,13 +567,17 @@ class TRPO(Agent):
         policy_loss_gradient = torch.autograd.grad(policy_loss, self.policy.parameters())
         flat_policy_loss_gradient = torch.cat([gradient.view(-1) for gradient in policy_loss_gradient])
 
+        # compute the KL divergence gradient once (it does not depend on the vector of the Fisher vector products)
+        flat_kl_gradient = kl_divergence_gradient(self.policy, sampled_states)
+
         # compute the search direction using the conjugate gradient algorithm
-        search_direction = conjugate_gradient(self.policy, sampled_states, flat_policy_loss_gradient.data,
+        search_direction = conjugate_gradient(self.policy, flat_kl_gradient, flat_policy_loss_gradient.data,
                                                 num_iterations=self._conjugate_gradient_steps)
 
         # compute step size and full step
-        xHx = (search_direction * fisher_vector_product(self.policy, sampled_states, search_direction, self._damping)) \
+        xHx = (search_direction * fisher_vector_product(self.policy, flat_kl_gradient, search_direction, self._damping)) \
             .sum(0, keepdim=True)
+        del flat_kl_gradient
         step_size = torch.sqrt(2 * self._max_kl_divergence / xHx)[0]
         full_step = step_size * search_direction
 
@@ -591,7 +610,8 @@ class TRPO(Agent):
         if self._rnn:
             sampled_rnn_batches = self.memory.sample_all(names=self._rnn_tensors_names, mini_batches=self._mini_batches, sequence_length=self._rnn_sequence_length)
 
-        cumulative_value_loss = 0
+        # accumulate the loss on the device to avoid synchronizing with the host on every mini-batch
+        cumulative_value_loss = torch.zeros((), device=self.device)
 
         # learning epochs
         for epoch in range(self._learning_epochs):
@@ -620,7 +640,7 @@ class TRPO(Agent):
                 self.value_optimizer.step()
 
                 # update cumulative losses
-                cumulative_value_loss += value_loss.item()
+                cumulative_value_loss += value_loss.detach()
 
             # update learning rate
             if self._learning_rate_scheduler:
@@ -628,7 +648,7 @@ class TRPO(Agent):
 
         # record data
         self.track_data("Loss / Policy loss", policy_loss.item())
-        self.track_data("Loss / Value loss", cumulative_value_loss / (self._learning_epochs * self._mini_batches))
+        self.track_data("Loss / Value loss", cumulative_value_loss.item() / (self._learning_epochs * self._mini_batches))
 
         self.track_data("Policy / Standard deviation", self.policy.distribution(role="policy").stddev.mean().item())
 
@@ -28,6 +28,15 @@ class Wrapper(object):
         else:
             self.device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
 
+        # page-locked staging buffer used to copy numpy arrays to CUDA devices
+        self._staging_buffer = None
+        self._staging_event = None
+
+        # persistent rewards, terminated and truncated tensors (vectorized environments)
+        self._reward_buffer = None
+        self._terminated_buffer = None
+        self._truncated_buffer = None
+
     def __getattr__(self, key: str) -> Any:
         """Get an attribute from the wrapped environment
 
@@ -44,6 +53,60 @@ class Wrapper(object):
         raise AttributeError("Wrapped environment ({}) does not have attribute '{}'" \
             .format(self._env.__class__.__name__, key))
 
+    def _array_to_tensor(self, array: np.ndarray) -> torch.Tensor:
+        """Convert a numpy array to a float32 tensor allocated on the wrapper's device
+
+        For CUDA devices, the array is cast to float32 into a page-locked (pinned) staging buffer
+        and then copied asynchronously to the device
+
+        :param array: The numpy array to convert
+        :type array: np.ndarray
+
+        :return: The array as a float32 tensor with the same shape
+        :rtype: torch.Tensor
+        """
+        if self.device.type != "cuda":
+            return torch.tensor(array, device=self.device, dtype=torch.float32)
+
+        # wait for the previous asynchronous copy before overwriting the staging buffer
+        if self._staging_event is None:
+            self._staging_event = torch.cuda.Event()
+        else:
+            self._staging_event.synchronize()
+        if self._staging_buffer is None or self._staging_buffer.shape != array.shape:
+            self._staging_buffer = torch.empty(array.shape, dtype=torch.float32, pin_memory=True)
+
+        self._staging_buffer.copy_(torch.from_numpy(array))
+        tensor = self._staging_buffer.to(self.device, non_blocking=True)
+        self._staging_event.record(torch.cuda.current_stream(self.device))
+        return tensor
+
+    def _copy_to_step_buffers(self, reward: np.ndarray, terminated: np.ndarray, truncated: np.ndarray) \
+        -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Copy the rewards and the terminated/truncated flags of a vectorized environment into persistent tensors
+
+        The tensors are allocated once, with shape (number of environments, 1), and overwritten on every call
+
+        :param reward: Rewards
+        :type reward: np.ndarray
+        :param terminated: Terminated flags
+        :type terminated: np.ndarray
+        :param truncated: Truncated flags
+        :type truncated: np.ndarray
+
+        :return: Reward, terminated and truncated tensors
+        :rtype: tuple of torch.Tensor
+        """
+        if self._reward_buffer is None:
+            self._reward_buffer = torch.empty((self.num_envs, 1), device=self.device, dtype=torch.float32)
+            self._terminated_buffer = torch.empty((self.num_envs, 1), device=self.device, dtype=torch.bool)
+            self._truncated_buffer = torch.empty((self.num_envs, 1), device=self.device, dtype=torch.bool)
+
+        self._reward_buffer.copy_(torch.from_numpy(np.asarray(reward)).reshape(self.num_envs, -1))
+        self._terminated_buffer.copy_(torch.from_numpy(np.asarray(terminated)).reshape(self.num_envs, -1))
+        self._truncated_buffer.copy_(torch.from_numpy(np.asarray(truncated)).reshape(self.num_envs, -1))
+        return self._reward_buffer, self._terminated_buffer, self._truncated_buffer
+
     def reset(self) -> Tuple[torch.Tensor, Any]:
         """Reset the environment
 
@@ -377,6 +440,9 @@ class GymWrapper(Wrapper):
         elif isinstance(observation, int):
             return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self.num_envs, -1)
         elif isinstance(observation, np.ndarray):
+            # the whole observation is staged in page-locked memory (not the components of composite spaces)
+            if space is observation_space:
+                return self._array_to_tensor(observation).view(self.num_envs, -1)
             return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
         elif isinstance(space, gym.spaces.Discrete):
             return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
@@ -422,7 +488,8 @@ class GymWrapper(Wrapper):
         :param actions: The actions to perform
         :type actions: torch.Tensor
 
-        :return: Observation, reward, terminated, truncated, info
+        :return: Observation, reward, terminated, truncated, info.
+                 For vectorized environments, the reward, terminated and truncated tensors are overwritten on every step
         :rtype: tuple of torch.Tensor and any other info
         """
         if self._drepecated_api:
@@ -440,9 +507,12 @@ class GymWrapper(Wrapper):
 
         # convert response to torch
         observation = self._observation_to_tensor(observation)
-        reward = torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
-        terminated = torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
-        truncated = torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
+        if self._vectorized:
+            reward, terminated, truncated = self._copy_to_step_buffers(reward, terminated, truncated)
+        else:
+            reward = torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
+            terminated = torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
+            truncated = torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
 
         # save observation and info for vectorized envs
         if self._vectorized:
@@ -546,6 +616,9 @@ class GymnasiumWrapper(Wrapper):
         elif isinstance(observation, int):
             return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self.num_envs, -1)
         elif isinstance(observation, np.ndarray):
+            # the whole observation is staged in page-locked memory (not the components of composite spaces)
+            if space is observation_space:
+                return self._array_to_tensor(observation).view(self.num_envs, -1)
             return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
         elif isinstance(space, gymnasium.spaces.Discrete):
             return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
@@ -591,16 +664,20 @@ class GymnasiumWrapper(Wrapper):
         :param actions: The actions to perform
         :type actions: torch.Tensor
 
-        :return: Observation, reward, terminated, truncated, info
+        :return: Observation, reward, terminated, truncated, info.
+                 For vectorized environments, the reward, terminated and truncated tensors are overwritten on every step
         :rtype: tuple of torch.Tensor and any other info
         """
         observation, reward, terminated, truncated, info = self._env.step(self._tensor_to_action(actions))
 
         # convert response to torch
         observation = self._observation_to_tensor(observation)
-        reward = torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
-        terminated = torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
-        truncated = torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
+        if self._vectorized:
+            reward, terminated, truncated = self._copy_to_step_buffers(reward, terminated, truncated)
+        else:
+            reward = torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
+            terminated = torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
+            truncated = torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
 
         # save observation and info for vectorized envs
         if self._vectorized:
@@ -10,7 +10,6 @@ import functools
 import numpy as np
 
 import torch
-from torch.utils.data.sampler import BatchSampler
 
 
 class Memory:
@@ -339,13 +338,20 @@ class Memory:
         :param mini_batches: Number of mini-batches to sample (default: 1)
         :type mini_batches: int, optional
 
+        :raises ValueError: There are fewer indexes than mini-batches
+
         :return: Sampled data from tensors sorted according to their position in the list of names.
                  The sampled tensors will have the following shape: (number of indexes, data size)
         :rtype: list of torch.Tensor list
         """
         if mini_batches > 1:
-            batches = BatchSampler(indexes, batch_size=len(indexes) // mini_batches, drop_last=True)
-            return [[self.tensors_view[name][batch] for name in names] for batch in batches]
+            # gather all the mini-batches at once (one indexing operation per tensor) and split them into views
+            batch_size = len(indexes) // mini_batches
+            if not batch_size:
+                raise ValueError(f"Unable to split {len(indexes)} indexes into {mini_batches} mini-batches")
+            batches = torch.as_tensor(indexes, dtype=torch.long, device=self.device)[:batch_size * mini_batches] \
+                .view(mini_batches, batch_size)
+            return [list(batch) for batch in zip(*[self.tensors_view[name][batches].unbind(0) for name in names])]
         return [[self.tensors_view[name][indexes] for name in names]]
 
     def sample_all(self, names: Tuple[str], mini_batches: int = 1, sequence_length: int = 1) -> List[List[torch.Tensor]]:
@@ -358,22 +364,24 @@ class Memory:
         :param sequence_length: Length of each sequence (default: 1)
         :type sequence_length: int, optional
 
+        :raises ValueError: There are fewer samples than mini-batches
+
         :return: Sampled data from memory.
-                 The sampled tensors will have the following shape: (memory size * number of environments, data size)
+                 The sampled tensors will have the following shape: (memory size * number of environments, data size).
+                 In the default order (``sequence_length`` equal to 1) the sampled tensors are views of the internal storage
         :rtype: list of torch.Tensor list
         """
         # sequential order
         if sequence_length > 1:
-            if mini_batches > 1:
-                batches = BatchSampler(self.all_sequence_indexes, batch_size=len(self.all_sequence_indexes) // mini_batches, drop_last=True)
-                return [[self.tensors_view[name][batch] for name in names] for batch in batches]
-            return [[self.tensors_view[name][self.all_sequence_indexes] for name in names]]
+            return self.sample_by_index(names=names, indexes=self.all_sequence_indexes, mini_batches=mini_batches)
 
-        # default order
+        # default order (mini-batches are contiguous slices, so they can be returned as views without copying)
         if mini_batches > 1:
-            indexes = np.arange(self.memory_size * self.num_envs)
-            batches = BatchSampler(indexes, batch_size=len(indexes) // mini_batches, drop_last=True)
-            return [[self.tensors_view[name][batch] for name in names] for batch in batches]
+            batch_size = (self.memory_size * self.num_envs) // mini_batches
+            if not batch_size:
+                raise ValueError(f"Unable to split {self.memory_size * self.num_envs} samples into {mini_batches} mini-batches")
+            batches = [(i * batch_size, (i + 1) * batch_size) for i in range(mini_batches)]
+            return [[self.tensors_view[name][start:end] for name in names] for start, end in batches]
         return [[self.tensors_view[name] for name in names]]
 
     def get_sampling_indexes(self) -> Union[tuple, np.ndarray, torch.Tensor]:
@@ -8,6 +8,41 @@ import torch
 import torch.nn as nn
 
 
+@torch.jit.script
+def _parallel_variance_update(running_mean: torch.Tensor,
+                              running_variance: torch.Tensor,
+                              current_count: torch.Tensor,
+                              input_mean: torch.Tensor,
+                              input_var: torch.Tensor,
+                              input_count: int) -> None:
+    """Update the running statistics in-place using the parallel algorithm for computing variance
+
+    The running statistics are rewritten in-place (without allocating new buffers) from the batch statistics,
+    which are computed by the caller in a single ``torch.var_mean`` reduction
+
+    :param running_mean: Running mean (updated in-place)
+    :type running_mean: torch.Tensor
+    :param running_variance: Running variance (updated in-place)
+    :type running_variance: torch.Tensor
+    :param current_count: Running count (updated in-place)
+    :type current_count: torch.Tensor
+    :param input_mean: Mean of the input data
+    :type input_mean: torch.Tensor
+    :param input_var: Variance of the input data
+    :type input_var: torch.Tensor
+    :param input_count: Batch size of the input data
+    :type input_count: int
+    """
+    delta = input_mean - running_mean
+    total_count = current_count + input_count
+    M2 = (running_variance * current_count) + (input_var * input_count) \
+        + delta ** 2 * current_count * input_count / total_count
+
+    running_mean.add_(delta * input_count / total_count)
+    running_variance.copy_(M2 / total_count)
+    current_count.copy_(total_count)
+
+
 class RunningStandardScaler(nn.Module):
     def __init__(self,
                  size: Union[int, Tuple[int], gym.Space, gymnasium.Space],
@@ -93,15 +128,8 @@ class RunningStandardScaler(nn.Module):
         :param input_count: Batch size of the input data
         :type input_count: int
         """
-        delta = input_mean - self.running_mean
-        total_count = self.current_count + input_count
-        M2 = (self.running_variance * self.current_count) + (input_var * input_count) \
-            + delta ** 2 * self.current_count * input_count / total_count
-
-        # update internal variables
-        self.running_mean = self.running_mean + delta * input_count / total_count
-        self.running_variance = M2 / total_count
-        self.current_count = total_count
+        _parallel_variance_update(self.running_mean, self.running_variance, self.current_count,
+                                  input_mean, input_var, input_count)
 
     def _compute(self, x: torch.Tensor, train: bool = False, inverse: bool = False) -> torch.Tensor:
         """Compute the standardization of the input data
@@ -115,9 +143,11 @@ class RunningStandardScaler(nn.Module):
         """
         if train:
             if x.dim() == 3:
-                self._parallel_variance(torch.mean(x, dim=(0,1)), torch.var(x, dim=(0,1)), x.shape[0] * x.shape[1])
+                input_var, input_mean = torch.var_mean(x, dim=(0,1))
+                self._parallel_variance(input_mean, input_var, x.shape[0] * x.shape[1])
             else:
-                self._parallel_variance(torch.mean(x, dim=0), torch.var(x, dim=0), x.shape[0])
+                input_var, input_mean = torch.var_mean(x, dim=0)
+                self._parallel_variance(input_mean, input_var, x.shape[0])
 
         # scale back the data to the original representation
         if inverse:
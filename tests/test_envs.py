@@ -3,6 +3,9 @@ import warnings
 import hypothesis
 import hypothesis.strategies as st
 
+import importlib
+import numpy as np
+
 import torch
 
 from skrl.envs.torch import Wrapper
@@ -34,3 +37,47 @@ def test_wrap_env(capsys, classes_and_kwargs, wrapper):
     env.state_space
     env.num_envs
     env.device
+
+@pytest.mark.parametrize("wrapper", ["gym", "gymnasium"])
+def test_vectorized_step(capsys, wrapper):
+    try:
+        module = importlib.import_module(wrapper)
+        env = module.vector.SyncVectorEnv([lambda: module.make("CartPole-v1")] * 3)
+    except Exception as e:
+        warnings.warn(f"Unable to create a vectorized '{wrapper}' environment ({e}). This test will be skipped")
+        return
+
+    env: Wrapper = wrap_env(env=env, wrapper=wrapper)
+    env.device = torch.device("cpu")
+    env.reset()
+
+    _, reward_1, terminated_1, truncated_1, _ = env.step(torch.zeros((3, 1), dtype=torch.int64))
+    reward_1_copy = reward_1.clone()
+    _, reward_2, terminated_2, truncated_2, _ = env.step(torch.zeros((3, 1), dtype=torch.int64))
+
+    for tensor, dtype in [(reward_2, torch.float32), (terminated_2, torch.bool), (truncated_2, torch.bool)]:
+        assert tensor.shape == torch.Size((3, 1))
+        assert tensor.dtype == dtype
+    assert torch.equal(reward_2, torch.ones((3, 1)))  # CartPole-v1 reward is 1 on every step
+    # the same tensors are overwritten on every step
+    assert reward_1 is reward_2 and terminated_1 is terminated_2 and truncated_1 is truncated_2
+    assert torch.equal(reward_1_copy, reward_2)
+
+    env.close()
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_array_to_tensor(capsys, device):
+    if device.startswith("cuda") and not torch.cuda.is_available():
+        warnings.warn(f"Invalid device: {device}. This test will be skipped")
+        return
+
+    env: Wrapper = Wrapper(DummyEnv(num_envs=1, device=device))
+
+    arrays = [np.random.rand(3, 4), np.random.rand(3, 4).astype(np.float32), np.random.rand(5, 2)]
+    tensors = [env._array_to_tensor(array) for array in arrays]
+
+    # previous tensors are not modified when the staging buffer is reused or reallocated
+    for array, tensor in zip(arrays, tensors):
+        assert tensor.device == torch.device(device)
+        assert tensor.dtype == torch.float32
+        assert torch.equal(tensor.cpu(), torch.from_numpy(array).float())
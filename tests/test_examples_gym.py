@@ -10,7 +10,8 @@ EXAMPLE_DIR = "gym"
 SCRIPTS = ["ddpg_gym_pendulum.py",
            "cem_gym_cartpole.py",
            "dqn_gym_cartpole.py",
-           "q_learning_gym_frozen_lake.py"]
+           "q_learning_gym_frozen_lake.py",
+           "a2c_gym_pendulumnovel.py"]
 EXAMPLES_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "docs", "source", "examples"))
 COMMANDS = [f"python {os.path.join(EXAMPLES_DIR, EXAMPLE_DIR, script)}" for script in SCRIPTS]
 
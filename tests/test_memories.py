@@ -70,3 +70,72 @@ def test_add_samples(capsys, classes_and_kwargs, memory_size, num_envs, num_samp
         assert memory.memory_index == (num_samples // num_envs) % memory_size
         assert memory.env_index == num_samples % num_envs
         assert memory.filled == (num_samples >= memory_size * num_envs)
+
+@hypothesis.given(memory_size=st.integers(min_value=1, max_value=100),
+                  num_envs=st.integers(min_value=1, max_value=10),
+                  mini_batches=st.integers(min_value=1, max_value=10))
+@hypothesis.settings(suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture], deadline=None)
+def test_sample_all(capsys, classes_and_kwargs, memory_size, num_envs, mini_batches):
+    for klass, kwargs in classes_and_kwargs:
+        memory: Memory = klass(memory_size=memory_size, num_envs=num_envs, **kwargs)
+
+        memory.create_tensor(name="tensor_1", size=1, dtype=torch.float32)
+        memory.create_tensor(name="tensor_2", size=2, dtype=torch.float32)
+
+        for i in range(memory_size):
+            memory.add_samples(tensor_1=torch.full((num_envs, 1), i), tensor_2=torch.full((num_envs, 2), i))
+
+        # fewer samples than mini-batches
+        if mini_batches > memory_size * num_envs:
+            with pytest.raises(ValueError):
+                memory.sample_all(names=["tensor_1", "tensor_2"], mini_batches=mini_batches)
+            continue
+
+        batches = memory.sample_all(names=["tensor_1", "tensor_2"], mini_batches=mini_batches)
+        batch_size = (memory_size * num_envs) // mini_batches if mini_batches > 1 else memory_size * num_envs
+
+        assert len(batches) == (mini_batches if mini_batches > 1 else 1)
+        for i, (tensor_1, tensor_2) in enumerate(batches):
+            assert tensor_1.shape == torch.Size((batch_size, 1))
+            assert tensor_2.shape == torch.Size((batch_size, 2))
+            assert torch.equal(tensor_1, memory.get_tensor_by_name("tensor_1", keepdim=False)[i * batch_size:(i + 1) * batch_size])
+
+        # the mini-batches are views of the memory storage
+        storage = memory.get_tensor_by_name("tensor_1", keepdim=False)
+        for i, (tensor_1, _) in enumerate(batches):
+            assert tensor_1.data_ptr() == storage[i * batch_size].data_ptr()
+        storage.fill_(-1)
+        for tensor_1, _ in batches:
+            assert torch.all(tensor_1 == -1)
+
+@hypothesis.given(memory_size=st.integers(min_value=1, max_value=100),
+                  num_indexes=st.integers(min_value=1, max_value=100),
+                  mini_batches=st.integers(min_value=1, max_value=10))
+@hypothesis.settings(suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture], deadline=None)
+def test_sample_by_index(capsys, classes_and_kwargs, memory_size, num_indexes, mini_batches):
+    for klass, kwargs in classes_and_kwargs:
+        memory: Memory = klass(memory_size=memory_size, **kwargs)
+
+        memory.create_tensor(name="tensor_1", size=1, dtype=torch.float32)
+
+        for i in range(memory_size):
+            memory.add_samples(tensor_1=torch.full((1,), i))
+
+        indexes = torch.randint(0, memory_size, (num_indexes,), device=memory.device)
+
+        # fewer indexes than mini-batches
+        if mini_batches > num_indexes:
+            with pytest.raises(ValueError):
+                memory.sample_by_index(names=["tensor_1"], indexes=indexes, mini_batches=mini_batches)
+            continue
+
+        batches = memory.sample_by_index(names=["tensor_1"], indexes=indexes, mini_batches=mini_batches)
+
+        if mini_batches > 1:
+            batch_size = num_indexes // mini_batches
+            assert len(batches) == mini_batches
+            for i, (tensor_1,) in enumerate(batches):
+                assert torch.equal(tensor_1.view(-1), indexes[i * batch_size:(i + 1) * batch_size].float())
+        else:
+            assert len(batches) == 1
+            assert torch.equal(batches[0][0].view(-1), indexes.float())
@@ -43,3 +43,27 @@ def test_forward(capsys, classes_and_kwargs, space_and_size):
 
         output = preprocessor(torch.rand((10, size), device="cpu"))
         assert output.shape == torch.Size((10, size))
+
+@hypothesis.given(num_batches=st.integers(min_value=1, max_value=5),
+                  batch_size=st.integers(min_value=2, max_value=100))
+@hypothesis.settings(suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture], deadline=None)
+def test_running_statistics(capsys, classes_and_kwargs, num_batches, batch_size):
+    for klass, kwargs in classes_and_kwargs:
+        preprocessor = klass(size=2, device="cpu")
+
+        data = torch.rand((num_batches, batch_size, 2), dtype=torch.float32)
+        for batch in data:
+            preprocessor(batch, train=True)
+
+        data = data.double()
+        running_count = 1 + num_batches * batch_size  # the count is initialized to one
+        running_mean = data.view(-1, 2).sum(dim=0) / running_count  # the mean is initialized to zero
+        # law of total variance over the initial statistics (mean 0, variance 1 and count 1) and the batches
+        # (whose variance is computed with Bessel's correction, as in the preprocessor)
+        M2 = 1 + running_mean ** 2 \
+            + (batch_size * data.var(dim=1) + batch_size * (data.mean(dim=1) - running_mean) ** 2).sum(dim=0)
+        running_variance = M2 / running_count
+
+        assert int(preprocessor.current_count.item()) == running_count
+        assert torch.allclose(preprocessor.running_mean, running_mean, atol=1e-5)
+        assert torch.allclose(preprocessor.running_variance, running_variance, atol=1e-5)